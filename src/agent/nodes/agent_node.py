@@ -29,6 +29,9 @@ def create_agent_node(llm, tools):
     # causing snapshot from wrong tab. Sequential execution ensures correctness.
     llm_with_tools = llm.bind_tools(tools, parallel_tool_calls=False)
 
+    # System prompt is static - build the message once instead of on every turn
+    system_message = SystemMessage(content=SYSTEM_PROMPT)
+
     def agent_node(state: BrowserAgentState) -> Command:
         """
         Core reasoning node.
@@ -57,12 +60,11 @@ def create_agent_node(llm, tools):
             )
 
         # Always use full prompt with all patterns
-        prompt = SYSTEM_PROMPT
         logger.debug("Using full system prompt")
 
         # Add system prompt if not present
         if not messages or not isinstance(messages[0], SystemMessage):
-            messages = [SystemMessage(content=prompt)] + list(messages)
+            messages = [system_message] + list(messages)
 
         # Tab intent analysis removed - let agent decide based on available tabs
         # Agent will check browser_tabs first and use existing tabs when appropriate
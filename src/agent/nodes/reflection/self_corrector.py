@@ -67,12 +67,12 @@ browser_click(target="button:Оформить заказ")
 
 ДЕЙСТВИЯ:
 
-1. Дождись загрузки DOM (быстрее чем networkidle):
-   browser_wait_for_load(state="domcontentloaded")
-
-2. Проверь что страница готова:
+1. DOM уже загружен — не жди загрузку повторно. Проверь страницу:
    browser_explore_page()
 
+2. Если нужный контент подгружается позже — жди конкретный элемент:
+   browser_wait_for(target="<селектор элемента>")
+
 3. Продолжай работу с найденными элементами
 
 НЕ жди networkidle на SPA сайтах — это может занять бесконечно!"""
@@ -81,16 +81,13 @@ browser_click(target="button:Оформить заказ")
 
 ДЕЙСТВИЯ:
 
-1. Перезагрузи страницу:
+1. Перезагрузи страницу (reload сам ждёт domcontentloaded):
    browser_reload()
 
-2. Дождись загрузки:
-   browser_wait_for_load(state="domcontentloaded")
-
-3. Исследуй страницу заново:
+2. Исследуй страницу заново:
    browser_explore_page()
 
-4. Найди нужный элемент и повтори действие
+3. Найди нужный элемент и повтори действие
 
 Если страница не загружается — проверь подключение к браузеру."""
 
@@ -1,10 +1,12 @@
 """Модульная система промптов для Browser Copilot Agent."""
 
+import functools
+import importlib
+import sys
+
 from src.agent.prompts.base import BASE_PROMPT
 from src.agent.prompts.browser_rules import BROWSER_RULES
 from src.agent.prompts.error_recovery import ERROR_RECOVERY_GUIDE
-from src.agent.prompts.examples.complex import COMPLEX_EXAMPLES
-from src.agent.prompts.examples.simple import SIMPLE_EXAMPLES
 
 __all__ = [
     # Модули
@@ -15,15 +17,62 @@ __all__ = [
     "COMPLEX_EXAMPLES",
     # Готовые промпты
     "SYSTEM_PROMPT",
+    # Сборка из секций
+    "PROMPT_SECTIONS",
+    "build_system_prompt",
 ]
 
+# Секции системного промпта по темам - промпт собирается только из нужных
+PROMPT_SECTIONS: dict[str, str] = {
+    "base": BASE_PROMPT,
+    "browser_rules": BROWSER_RULES,
+    "error_recovery": ERROR_RECOVERY_GUIDE,
+}
+
+
+@functools.lru_cache(maxsize=32)
+def build_system_prompt(*sections: str) -> str:
+    """
+    Assemble a system prompt from named sections.
+
+    Results are cached by the section tuple, so repeated builds of the
+    same combination return the same string object.
+
+    Args:
+        *sections: Section names from PROMPT_SECTIONS, in prompt order.
+                   Defaults to all sections.
+
+    Returns:
+        Sections joined with blank lines
+
+    Raises:
+        KeyError: If a section name is unknown
+
+    Example:
+        >>> build_system_prompt("base", "error_recovery")
+    """
+    names = sections or tuple(PROMPT_SECTIONS)
+    return sys.intern("\n\n".join(PROMPT_SECTIONS[name] for name in names))
+
+
 # Базовый системный промпт (по умолчанию)
 # PLAYWRIGHT_PATTERNS удалён - код теперь инкапсулирован в browser tools
 # Tools описываются через bind_tools() - не дублируем в промпте
-SYSTEM_PROMPT = "\n\n".join(
-    [
-        BASE_PROMPT,
-        BROWSER_RULES,
-        ERROR_RECOVERY_GUIDE,
-    ]
-)
+# Собирается один раз при импорте; sys.intern - одна и та же строка для всех вызовов
+SYSTEM_PROMPT = build_system_prompt("base", "browser_rules", "error_recovery")
+
+# Примеры не входят в SYSTEM_PROMPT - загружаются лениво при первом обращении (PEP 562)
+_LAZY_EXAMPLES = {
+    "SIMPLE_EXAMPLES": "src.agent.prompts.examples.simple",
+    "COMPLEX_EXAMPLES": "src.agent.prompts.examples.complex",
+}
+
+
+def __getattr__(name: str) -> str:
+    """Lazily import example prompts on first access."""
+    module_path = _LAZY_EXAMPLES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
@@ -105,20 +105,7 @@ BASE_PROMPT = """Ты автономный AI-агент для управлен
 
 ## Когда действия не работают
 
-Если браузерное действие не сработало, система автоматически определит тип ошибки и даст инструкции по восстановлению.
-
-**Общий подход:**
-1. Получишь сообщение с конкретными tools для recovery
-2. Выполни предложенные tools
-3. Повтори исходное действие
-4. Если не помогает — попробуй альтернативный подход
-
-**Типичные recovery tools:**
-- browser_close_modal() — закрыть модалку/overlay
-- browser_scroll(target="...") — прокрутить к элементу
-- browser_wait_for_load() — дождаться загрузки страницы
-- browser_explore_page() — получить актуальные селекторы
-- browser_reload() — перезагрузить страницу
+Если браузерное действие не сработало, система автоматически определит тип ошибки и даст инструкции по восстановлению — см. раздел "Восстановление после ошибок".
 
 ## Когда просить помощь пользователя
 
@@ -35,6 +35,7 @@ BROWSER_RULES = """## Правила работы с браузером
 - browser_navigate автоматически реализует правильный workflow с вкладками
 - Для ручного управления: browser_list_tabs, browser_switch_tab
 - При работе с несколькими сайтами - используй разные вкладки
+- Для задач извлечения текста/данных: browser_navigate(url, block_resources=True) - без картинок, медиа и шрифтов страница грузится быстрее. Не используй, если нужны скриншоты или внешний вид страницы
 
 ### Модалки и overlays
 
@@ -52,6 +53,8 @@ BROWSER_RULES = """## Правила работы с браузером
 - Label: "label:Username"
 - TestId: "testid:submit-btn"
 
+Предпочитай testid и CSS (#id, .class) - они находятся быстрее, чем role/text, которым нужно обойти всю страницу. Бери готовые селекторы из browser_explore_page.
+
 ### Подтверждение пользователя
 
 Используй request_user_confirmation для:
@@ -28,9 +28,9 @@ ERROR_RECOVERY_GUIDE = """## Восстановление после ошибо
 - Если не помогло — browser_close_modal(strategy="escape")
 
 **Page not loading:**
-1. browser_reload() — перезагрузить страницу
-2. browser_wait_for_load(state="domcontentloaded") — дождаться DOM
-3. browser_explore_page() — проверить что загрузилось
+1. browser_reload() — перезагрузить страницу (уже ждёт domcontentloaded)
+2. browser_explore_page() — проверить что загрузилось
+Не добавляй wait_for_load("load"/"networkidle") после reload/navigate — DOM уже готов.
 
 **Click happened but nothing changed:**
 1. browser_get_page_info() — проверить URL (может уже перешли)
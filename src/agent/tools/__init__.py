@@ -14,37 +14,42 @@ Usage:
     tools = get_browser_tools()
 """
 
+import functools
+import importlib
+
 from src.agent.tools._executor import BrowserExecutor
-from src.agent.tools.exploration import browser_explore_page, browser_inspect_container
-from src.agent.tools.extraction import (
-    browser_get_attribute,
-    browser_get_page_info,
-    browser_get_text,
-)
-from src.agent.tools.fallback import browser_run_custom
-from src.agent.tools.interaction import (
-    browser_check,
-    browser_click,
-    browser_fill,
-    browser_hover,
-    browser_press_key,
-    browser_select,
-)
-from src.agent.tools.navigation import browser_navigate
-from src.agent.tools.special import (
-    browser_close_modal,
-    browser_go_back,
-    browser_reload,
-    browser_scroll,
-)
-from src.agent.tools.tabs import (
-    browser_close_tab,
-    browser_list_tabs,
-    browser_new_tab,
-    browser_switch_tab,
-)
-from src.agent.tools.user_confirmation import request_user_confirmation
-from src.agent.tools.waiting import browser_wait_for, browser_wait_for_load
+
+# Tool modules are imported lazily on first access (PEP 562), so importing
+# the package (e.g. for BrowserExecutor) does not load every tool module.
+_LAZY_TOOLS = {
+    "browser_explore_page": "src.agent.tools.exploration",
+    "browser_inspect_container": "src.agent.tools.exploration",
+    "browser_get_attribute": "src.agent.tools.extraction",
+    "browser_get_list": "src.agent.tools.extraction",
+    "browser_get_page_info": "src.agent.tools.extraction",
+    "browser_get_text": "src.agent.tools.extraction",
+    "browser_run_custom": "src.agent.tools.fallback",
+    "browser_check": "src.agent.tools.interaction",
+    "browser_click": "src.agent.tools.interaction",
+    "browser_fill": "src.agent.tools.interaction",
+    "browser_fill_form": "src.agent.tools.interaction",
+    "browser_hover": "src.agent.tools.interaction",
+    "browser_press_key": "src.agent.tools.interaction",
+    "browser_select": "src.agent.tools.interaction",
+    "browser_navigate": "src.agent.tools.navigation",
+    "browser_close_modal": "src.agent.tools.special",
+    "browser_go_back": "src.agent.tools.special",
+    "browser_reload": "src.agent.tools.special",
+    "browser_scroll": "src.agent.tools.special",
+    "browser_close_tab": "src.agent.tools.tabs",
+    "browser_list_tabs": "src.agent.tools.tabs",
+    "browser_new_tab": "src.agent.tools.tabs",
+    "browser_switch_tab": "src.agent.tools.tabs",
+    "request_user_confirmation": "src.agent.tools.user_confirmation",
+    "browser_wait_for": "src.agent.tools.waiting",
+    "browser_wait_for_load": "src.agent.tools.waiting",
+}
+
 
 __all__ = [
     # Executor
@@ -62,12 +67,14 @@ __all__ = [
     # Interaction
     "browser_click",
     "browser_fill",
+    "browser_fill_form",
     "browser_press_key",
     "browser_select",
     "browser_hover",
     "browser_check",
     # Extraction
     "browser_get_text",
+    "browser_get_list",
     "browser_get_attribute",
     "browser_get_page_info",
     # Waiting
@@ -105,36 +112,59 @@ def get_browser_tools() -> list:
             "Call BrowserExecutor.initialize(browser_run_code_tool) first."
         )
 
-    return [
-        # Exploration (USE FIRST on new pages!)
-        browser_explore_page,
-        # browser_inspect_container,  # Временно отключен - влияет на reasoning LLM
-        # Navigation
-        browser_navigate,
-        # Tabs
-        browser_list_tabs,
-        browser_switch_tab,
-        browser_new_tab,
-        browser_close_tab,
-        # Interaction
-        browser_click,
-        browser_fill,
-        browser_press_key,
-        browser_select,
-        browser_hover,
-        browser_check,
-        # Extraction
-        browser_get_text,
-        browser_get_attribute,
-        browser_get_page_info,
-        # Waiting
-        browser_wait_for,
-        browser_wait_for_load,
-        # Special
-        browser_close_modal,
-        browser_scroll,
-        browser_go_back,
-        browser_reload,
-        # Fallback
-        browser_run_custom,
-    ]
+    # Fresh list per call so callers can extend it without touching the cache
+    return list(_load_browser_tools())
+
+
+@functools.cache
+def _load_browser_tools() -> tuple:
+    """Resolve the tool objects once; they are immutable module singletons."""
+    return tuple(globals().get(name) or __getattr__(name) for name in _BROWSER_TOOL_NAMES)
+
+
+# Order of tools exposed to the LLM
+_BROWSER_TOOL_NAMES = (
+    # Exploration (USE FIRST on new pages!)
+    "browser_explore_page",
+    # "browser_inspect_container",  # Временно отключен - влияет на reasoning LLM
+    # Navigation
+    "browser_navigate",
+    # Tabs
+    "browser_list_tabs",
+    "browser_switch_tab",
+    "browser_new_tab",
+    "browser_close_tab",
+    # Interaction
+    "browser_click",
+    "browser_fill",
+    "browser_fill_form",
+    "browser_press_key",
+    "browser_select",
+    "browser_hover",
+    "browser_check",
+    # Extraction
+    "browser_get_text",
+    "browser_get_list",
+    "browser_get_attribute",
+    "browser_get_page_info",
+    # Waiting
+    "browser_wait_for",
+    "browser_wait_for_load",
+    # Special
+    "browser_close_modal",
+    "browser_scroll",
+    "browser_go_back",
+    "browser_reload",
+    # Fallback
+    "browser_run_custom",
+)
+
+
+def __getattr__(name: str):
+    """Lazily import a tool from its module on first access."""
+    module_path = _LAZY_TOOLS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
@@ -2,11 +2,17 @@
 
 import json
 import re
+from json.decoder import scanstring
 
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Result block of an @playwright/mcp response, matched against the text
+# starting at "### Result": a quoted (escaped) JSON string, or a bare value
+_RESULT_QUOTED_RE = re.compile(r'### Result\s*\n"(.*?)"(?:\s*\n|$)', re.DOTALL)
+_RESULT_BARE_RE = re.compile(r"### Result\s*\n(.+?)(?:\n###|$)", re.DOTALL)
+
 
 class BrowserExecutor:
     """
@@ -21,11 +27,23 @@ class BrowserExecutor:
     - Track the "target page URL" that tools should operate on
     - Each browser_run_code call finds the correct page by URL pattern
     - This allows multi-tab workflows without relying on MCP's tab tracking
+
+    Browser lifecycle:
+    The browser and its context are owned by the MCP server and reused for
+    the whole session. Tool code only opens/closes pages; it must never
+    launch or close the browser or context.
     """
 
     _browser_run_code_tool = None
     _initialized = False
     _target_page_url: str | None = None  # URL pattern to find target page
+    _page_finder_code: str | None = None  # Cached finder JS for _target_page_url
+
+    # Default timeouts for the target page. Playwright's 30 s default stalls
+    # a whole agent step; tools pass their own timeout only when they need
+    # a different value.
+    DEFAULT_TIMEOUT_MS = 10000
+    DEFAULT_NAVIGATION_TIMEOUT_MS = 15000
 
     @classmethod
     def initialize(cls, browser_run_code_tool) -> None:
@@ -40,6 +58,7 @@ class BrowserExecutor:
         cls._browser_run_code_tool = browser_run_code_tool
         cls._initialized = True
         cls._target_page_url = None
+        cls._page_finder_code = None
         logger.info("BrowserExecutor initialized with browser_run_code tool")
 
     @classmethod
@@ -69,15 +88,17 @@ class BrowserExecutor:
         Returns:
             Extracted JSON string, or original text if no Result block found
         """
-        if "### Result" not in text:
+        start = text.find("### Result")
+        if start == -1:
             return text
 
         # Pattern to match: ### Result\n"<json string>"\n
-        # The JSON is escaped and wrapped in quotes
-        match = re.search(r'### Result\s*\n"(.*?)"(?:\s*\n|$)', text, re.DOTALL)
+        # The JSON is escaped and wrapped in quotes. Matching is anchored at
+        # the block start, so nothing before it is scanned.
+        match = _RESULT_QUOTED_RE.match(text, start)
         if not match:
             # Try alternative: JSON might not be in quotes (direct value)
-            match = re.search(r'### Result\s*\n(.+?)(?:\n###|$)', text, re.DOTALL)
+            match = _RESULT_BARE_RE.match(text, start)
             if match:
                 return match.group(1).strip()
             return text
@@ -86,15 +107,22 @@ class BrowserExecutor:
 
         # Unescape the JSON string (it's double-escaped from MCP)
         try:
-            # First unescape: convert \" to " and \\ to \
-            unescaped = escaped_json.replace('\\"', '"').replace("\\\\", "\\")
-
-            # Validate it's proper JSON
-            json.loads(unescaped)
+            if "\\" not in escaped_json:
+                # Nothing is escaped - no decoding needed
+                unescaped = escaped_json
+            else:
+                # The block is a JSON string literal: decode it in one C-level
+                # pass from the opening quote. Unlike chained str.replace this
+                # handles every escape sequence (quotes, backslashes, newlines,
+                # unicode escapes) correctly.
+                unescaped, _ = scanstring(text, match.start(1))
+
+            # Not parsed here: every caller runs json.loads on the result and
+            # handles invalid JSON itself, so validating would parse it twice
             return unescaped
         except json.JSONDecodeError:
             # If unescaping failed, try the original
-            logger.warning(f"Failed to unescape JSON, using original: {escaped_json[:100]}...")
+            logger.warning("Failed to unescape JSON, using original: %.100s...", escaped_json)
             return escaped_json
 
     @classmethod
@@ -118,11 +146,12 @@ class BrowserExecutor:
                 "Call BrowserExecutor.initialize(tool) first."
             )
 
-        logger.debug(f"Executing Playwright code: {code[:100]}...")
+        logger.debug("Executing Playwright code: %.100s...", code)
 
         result = await cls._browser_run_code_tool.ainvoke({"code": code})
 
-        logger.debug(f"Execution raw result type: {type(result)}, value: {str(result)[:200]}...")
+        # %-style args: str(result) and truncation only happen if DEBUG is enabled
+        logger.debug("Execution raw result type: %s, value: %.200s...", type(result), result)
 
         # MCP tool может возвращать разные типы:
         # - str: прямой результат (часто в markdown формате от @playwright/mcp)
@@ -139,7 +168,14 @@ class BrowserExecutor:
                     texts.append(item["text"])
                 elif isinstance(item, str):
                     texts.append(item)
-            raw_text = "\n".join(texts) if texts else str(result)
+            # Блок с "### Result" разбираем отдельно - склеиваем все блоки,
+            # только если результата нет ни в одном из них
+            for text in texts:
+                if "### Result" in text:
+                    raw_text = text
+                    break
+            else:
+                raw_text = "\n".join(texts) if texts else str(result)
         elif isinstance(result, dict):
             # Попробовать извлечь text или content
             if "text" in result:
@@ -153,7 +189,7 @@ class BrowserExecutor:
 
         # Extract JSON from MCP markdown response format
         extracted = cls._extract_json_from_mcp_response(raw_text)
-        logger.debug(f"Extracted result: {extracted[:200]}...")
+        logger.debug("Extracted result: %.200s...", extracted)
 
         return extracted
 
@@ -169,7 +205,8 @@ class BrowserExecutor:
             url_pattern: URL substring to match (e.g., 'lavka.yandex.ru')
         """
         cls._target_page_url = url_pattern
-        logger.debug(f"Target page set to: {url_pattern}")
+        cls._page_finder_code = None
+        logger.debug("Target page set to: %s", url_pattern)
 
     @classmethod
     def get_target_page(cls) -> str | None:
@@ -183,9 +220,25 @@ class BrowserExecutor:
 
         Returns JS code that sets `targetPage` variable to the correct page.
         If no target URL is set, uses the default `page` from MCP.
+        Also applies DEFAULT_TIMEOUT_MS and DEFAULT_NAVIGATION_TIMEOUT_MS to
+        the page (local setters, no round-trip to the browser).
+
+        The code is built once per target and reused until set_target_page
+        changes it.
         """
+        if cls._page_finder_code is None:
+            cls._page_finder_code = cls._build_page_finder_code()
+        return cls._page_finder_code
+
+    @classmethod
+    def _build_page_finder_code(cls) -> str:
+        """Build the page finder JS for the current target URL pattern."""
         if cls._target_page_url is None:
-            return "const targetPage = page;"
+            return (
+                "const targetPage = page;\n"
+                f"    targetPage.setDefaultTimeout({cls.DEFAULT_TIMEOUT_MS});\n"
+                f"    targetPage.setDefaultNavigationTimeout({cls.DEFAULT_NAVIGATION_TIMEOUT_MS});"
+            )
 
         escaped_url = cls._target_page_url.replace("'", "\\'")
         return f"""
@@ -195,4 +248,6 @@ class BrowserExecutor:
         // Fallback to last page (most recently created) or default page
         targetPage = allPages.length > 0 ? allPages[allPages.length - 1] : page;
     }}
+    targetPage.setDefaultTimeout({cls.DEFAULT_TIMEOUT_MS});
+    targetPage.setDefaultNavigationTimeout({cls.DEFAULT_NAVIGATION_TIMEOUT_MS});
 """
@@ -12,13 +12,14 @@ Supported formats:
 - Testid: testid:submit-button
 """
 
+import functools
 from dataclasses import dataclass
 from typing import Literal
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParsedSelector:
-    """Parsed selector information."""
+    """Parsed selector information (immutable, so parsed results can be shared)."""
 
     type: Literal["role", "text", "placeholder", "label", "css", "testid"]
     value: str
@@ -28,7 +29,7 @@ class ParsedSelector:
 
 # Common HTML tags that should be treated as CSS tag selectors
 # These are interpreted as page.locator('tag') not page.getByText('tag')
-HTML_TAGS = {
+HTML_TAGS = frozenset({
     # Document structure
     "html",
     "head",
@@ -99,10 +100,10 @@ HTML_TAGS = {
     "mark",
     "time",
     "address",
-}
+})
 
 # ARIA roles supported by Playwright getByRole()
-SUPPORTED_ROLES = {
+SUPPORTED_ROLES = frozenset({
     "button",
     "link",
     "textbox",
@@ -139,13 +140,26 @@ SUPPORTED_ROLES = {
     "treeitem",
     "grid",
     "gridcell",
+})
+
+
+# Explicit "prefix:value" formats and the selector type they map to
+_PREFIX_TYPES = {
+    "text": "text",
+    "placeholder": "placeholder",
+    "label": "label",
+    "testid": "testid",
 }
 
 
+@functools.lru_cache(maxsize=512)
 def parse_target(target: str) -> ParsedSelector:
     """
     Parse target string into structured selector information.
 
+    Results are cached: agents reuse the same few targets ("button",
+    "testid:...", CSS from browser_explore_page) across a whole workflow.
+
     Args:
         target: Target string in one of supported formats
 
@@ -162,56 +176,52 @@ def parse_target(target: str) -> ParsedSelector:
         >>> parse_target("text:Add to cart")
         ParsedSelector(type='text', value='Add to cart')
     """
-    # Explicit prefixes
-    if target.startswith("text:"):
-        return ParsedSelector(type="text", value=target[5:])
-
-    if target.startswith("placeholder:"):
-        return ParsedSelector(type="placeholder", value=target[12:])
+    # Split once; the head is used for both explicit prefixes and role:name
+    head, sep, rest = target.partition(":")
 
-    if target.startswith("label:"):
-        return ParsedSelector(type="label", value=target[6:])
-
-    if target.startswith("testid:"):
-        return ParsedSelector(type="testid", value=target[7:])
+    # Explicit prefixes
+    if sep and head in _PREFIX_TYPES:
+        return ParsedSelector(type=_PREFIX_TYPES[head], value=rest)
 
     # CSS multiple selector (contains comma) - e.g., "span, p, div"
     if "," in target:
         return ParsedSelector(type="css", value=target)
 
     # CSS selectors (start with . # or [)
-    if target.startswith(".") or target.startswith("#") or target.startswith("["):
+    if target and target[0] in ".#[":
         return ParsedSelector(type="css", value=target)
 
-    # Check for role patterns (role:name or just role)
-    if ":" in target:
-        parts = target.split(":", 1)
-        role = parts[0].lower()
-        name = parts[1] if len(parts) > 1 else None
-
+    # Check for role patterns (role:name)
+    if sep:
+        role = head.lower()
         if role in SUPPORTED_ROLES:
-            return ParsedSelector(type="role", value=target, role=role, name=name)
+            return ParsedSelector(type="role", value=target, role=role, name=rest)
+
+    # Lowercase once for both the role-name and the tag-name checks
+    lowered = target.lower()
 
     # Check if it's just a role name
-    if target.lower() in SUPPORTED_ROLES:
-        return ParsedSelector(type="role", value=target, role=target.lower(), name=None)
+    if lowered in SUPPORTED_ROLES:
+        return ParsedSelector(type="role", value=target, role=lowered, name=None)
 
     # Check if it's an HTML tag name (treat as CSS selector)
-    if target.lower() in HTML_TAGS:
-        return ParsedSelector(type="css", value=target.lower())
+    if lowered in HTML_TAGS:
+        return ParsedSelector(type="css", value=lowered)
 
     # Default: treat as text
     return ParsedSelector(type="text", value=target)
 
 
-def generate_locator_js(parsed: ParsedSelector, page_var: str = "page") -> str:
+def _append_locator(base: str, parsed: ParsedSelector) -> str:
     """
-    Generate Playwright locator JavaScript code from parsed selector.
+    Append the locator call for a parsed selector to a page or locator expression.
+
+    Shared by single targets (base is the page variable) and every part of a
+    ' >> ' chain (base is the locator built so far).
 
     Args:
+        base: JavaScript expression to call the locator method on
         parsed: ParsedSelector from parse_target()
-        page_var: Variable name for the page object (default "page").
-                  Use "targetPage" for multi-tab support.
 
     Returns:
         JavaScript code string for Playwright locator
@@ -220,40 +230,54 @@ def generate_locator_js(parsed: ParsedSelector, page_var: str = "page") -> str:
         if parsed.name:
             # Escape single quotes in name
             escaped_name = parsed.name.replace("'", "\\'")
-            return f"{page_var}.getByRole('{parsed.role}', {{ name: '{escaped_name}' }})"
-        return f"{page_var}.getByRole('{parsed.role}')"
+            return f"{base}.getByRole('{parsed.role}', {{ name: '{escaped_name}' }})"
+        return f"{base}.getByRole('{parsed.role}')"
+
+    escaped = parsed.value.replace("'", "\\'")
 
     if parsed.type == "text":
-        escaped_text = parsed.value.replace("'", "\\'")
-        return f"{page_var}.getByText('{escaped_text}')"
+        return f"{base}.getByText('{escaped}')"
 
     if parsed.type == "placeholder":
-        escaped = parsed.value.replace("'", "\\'")
-        return f"{page_var}.getByPlaceholder('{escaped}')"
+        return f"{base}.getByPlaceholder('{escaped}')"
 
     if parsed.type == "label":
-        escaped = parsed.value.replace("'", "\\'")
-        return f"{page_var}.getByLabel('{escaped}')"
+        return f"{base}.getByLabel('{escaped}')"
 
     if parsed.type == "testid":
-        escaped = parsed.value.replace("'", "\\'")
-        return f"{page_var}.getByTestId('{escaped}')"
+        return f"{base}.getByTestId('{escaped}')"
 
     if parsed.type == "css":
-        escaped = parsed.value.replace("'", "\\'")
-        return f"{page_var}.locator('{escaped}')"
+        return f"{base}.locator('{escaped}')"
 
     # Fallback to text
-    escaped = parsed.value.replace("'", "\\'")
-    return f"{page_var}.getByText('{escaped}')"
+    return f"{base}.getByText('{escaped}')"
+
+
+@functools.lru_cache(maxsize=512)
+def generate_locator_js(parsed: ParsedSelector, page_var: str = "page") -> str:
+    """
+    Generate Playwright locator JavaScript code from parsed selector.
+
+    Args:
+        parsed: ParsedSelector from parse_target()
+        page_var: Variable name for the page object (default "page").
+                  Use "targetPage" for multi-tab support.
+
+    Returns:
+        JavaScript code string for Playwright locator
+    """
+    return _append_locator(page_var, parsed)
 
 
+@functools.lru_cache(maxsize=1024)
 def target_to_locator_js(target: str, page_var: str = "page") -> str:
     """
     Convert target string directly to Playwright locator JavaScript.
 
     Convenience function combining parse_target and generate_locator_js.
-    Supports Playwright chaining syntax with ' >> '.
+    Supports Playwright chaining syntax with ' >> '. The output depends only
+    on the arguments, so it is cached per (target, page_var).
 
     Args:
         target: Target string in any supported format.
@@ -266,33 +290,8 @@ def target_to_locator_js(target: str, page_var: str = "page") -> str:
         JavaScript code string for Playwright locator
     """
     # Support Playwright chaining syntax: "selector1 >> selector2 >> selector3"
-    if " >> " in target:
-        parts = target.split(" >> ")
-        # First part uses the page variable
-        result = generate_locator_js(parse_target(parts[0]), page_var)
-        # Subsequent parts chain with .locator()
-        for part in parts[1:]:
-            parsed = parse_target(part)
-            if parsed.type == "css":
-                escaped = parsed.value.replace("'", "\\'")
-                result = f"{result}.locator('{escaped}')"
-            elif parsed.type == "role":
-                if parsed.name:
-                    escaped_name = parsed.name.replace("'", "\\'")
-                    result = f"{result}.getByRole('{parsed.role}', {{ name: '{escaped_name}' }})"
-                else:
-                    result = f"{result}.getByRole('{parsed.role}')"
-            elif parsed.type == "text":
-                escaped = parsed.value.replace("'", "\\'")
-                result = f"{result}.getByText('{escaped}')"
-            elif parsed.type == "testid":
-                escaped = parsed.value.replace("'", "\\'")
-                result = f"{result}.getByTestId('{escaped}')"
-            else:
-                # Default: use locator for other types
-                escaped = parsed.value.replace("'", "\\'")
-                result = f"{result}.locator('{escaped}')"
-        return result
-
-    parsed = parse_target(target)
-    return generate_locator_js(parsed, page_var)
+    # Each part is scoped to the previous one; the first starts from the page
+    result = page_var
+    for part in target.split(" >> "):
+        result = _append_locator(result, parse_target(part))
+    return result
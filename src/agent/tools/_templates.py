@@ -4,21 +4,26 @@ This module contains reusable JavaScript code fragments that are embedded
 into the generated Playwright code by browser tools.
 """
 
+from src.agent.tools._executor import BrowserExecutor
+
 # Clean text from invisible Unicode characters
-# Used by: browser_get_text, browser_get_attribute
+# Used by: browser_get_text, browser_get_attribute, browser_explore_page,
+# browser_inspect_container (interpolated into in-page callbacks)
 CLEAN_TEXT_JS = """
 function cleanText(text) {
   if (!text) return '';
   return text
     .replace(/\\xAD/g, '')  // Remove soft hyphens completely
-    .replace(/[\\u200B-\\u200D\\uFEFF\\xA0]/g, ' ')
-    .replace(/\\s+/g, ' ')
+    .replace(/[\\s\\u200B-\\u200D]+/g, ' ')  // \\s already covers \\xA0 and \\uFEFF
     .trim();
 }
 """
 
 # Validate that an action had an effect
 # Used by: browser_click (verify mode)
+# Use it for stateful conditions (count decreased, attribute changed). For
+# "a new element appeared" prefer an event-driven locator wait instead:
+#   locator.nth(countBefore).waitFor({ state: 'attached' })
 POST_ACTION_VALIDATION_JS = """
 async function validateAction(page, checkFn, timeout = 3000) {
   const startTime = Date.now();
@@ -30,6 +35,47 @@ async function validateAction(page, checkFn, timeout = 3000) {
 }
 """
 
+# Wait until no requests are in flight for a quiet window
+# Used by: browser_wait_for_load (state="networkidle")
+# Long-lived websocket/eventsource requests are ignored so SPA background
+# connections don't block the wait; returns false instead of throwing on max.
+# Listeners are attached before the optional `ready` promise (e.g. a
+# domcontentloaded wait) so requests started meanwhile are tracked. Requests
+# already in flight before the call are invisible; a full quiet window after
+# attaching is always required, which only partly covers them.
+NETWORK_QUIET_JS = """
+async function waitForNetworkQuiet(page, { quiet = 500, max = 15000, ready = null } = {}) {
+  const pending = new Set();
+  const onRequest = r => {
+    const type = r.resourceType();
+    if (type !== 'websocket' && type !== 'eventsource') pending.add(r);
+  };
+  const onDone = r => pending.delete(r);
+  page.on('request', onRequest);
+  page.on('requestfinished', onDone);
+  page.on('requestfailed', onDone);
+  const startTime = Date.now();
+  try {
+    if (ready) await ready;
+    let idleSince = null;
+    while (Date.now() - startTime < max) {
+      if (pending.size === 0) {
+        idleSince ??= Date.now();
+        if (Date.now() - idleSince >= quiet) return true;
+      } else {
+        idleSince = null;
+      }
+      await new Promise(r => setTimeout(r, 100));
+    }
+    return false;
+  } finally {
+    page.off('request', onRequest);
+    page.off('requestfinished', onDone);
+    page.off('requestfailed', onDone);
+  }
+}
+"""
+
 # Build error response object
 ERROR_RESPONSE_JS = """
 function errorResponse(message, details = {}) {
@@ -91,6 +137,15 @@ def wrap_with_error_handling(code: str) -> str:
   }}
 }}"""
 
+# Helper snippets available to build_async_function by name
+_HELPER_MAP = {
+    "cleanText": CLEAN_TEXT_JS,
+    "validateAction": POST_ACTION_VALIDATION_JS,
+    "waitForNetworkQuiet": NETWORK_QUIET_JS,
+    "errorResponse": ERROR_RESPONSE_JS,
+    "successResponse": SUCCESS_RESPONSE_JS,
+}
+
 
 def build_async_function(
     body: str,
@@ -104,7 +159,8 @@ def build_async_function(
         body: Main function body (JavaScript code)
               When use_target_page=True, use 'targetPage' instead of 'page' in body
         helpers: List of helper function names to include
-                 Options: 'cleanText', 'validateAction', 'errorResponse', 'successResponse'
+                 Options: 'cleanText', 'validateAction', 'waitForNetworkQuiet',
+                 'errorResponse', 'successResponse'
         use_target_page: If True, includes page finder code and sets 'targetPage' variable.
                         The body should use 'targetPage' for operations that need to
                         target the correct tab in multi-tab scenarios.
@@ -112,24 +168,13 @@ def build_async_function(
     Returns:
         Complete async (page) => { ... } function
     """
-    helper_code = ""
-
-    if helpers:
-        helper_map = {
-            "cleanText": CLEAN_TEXT_JS,
-            "validateAction": POST_ACTION_VALIDATION_JS,
-            "errorResponse": ERROR_RESPONSE_JS,
-            "successResponse": SUCCESS_RESPONSE_JS,
-        }
-        for helper in helpers:
-            if helper in helper_map:
-                helper_code += helper_map[helper] + "\n"
-
-    # Page finder code for multi-tab support
-    page_finder = ""
-    if use_target_page:
-        from src.agent.tools._executor import BrowserExecutor
-        page_finder = BrowserExecutor.get_page_finder_code()
+    # One join instead of growing a string per helper
+    helper_code = "".join(
+        f"{_HELPER_MAP[helper]}\n" for helper in helpers or () if helper in _HELPER_MAP
+    )
+
+    # Page finder code for multi-tab support (cached by BrowserExecutor)
+    page_finder = BrowserExecutor.get_page_finder_code() if use_target_page else ""
 
     return f"""async (page) => {{
   try {{
@@ -9,7 +9,27 @@ import json
 from langchain_core.tools import tool
 
 from src.agent.tools._executor import BrowserExecutor
-from src.agent.tools._templates import build_async_function
+from src.agent.tools._templates import CLEAN_TEXT_JS, build_async_function
+
+# Element categories discovered by browser_explore_page (plain CSS, so they
+# can be re-checked in the page with Element.matches)
+_EXPLORE_SELECTORS = {
+    # Standard buttons + cart-like links + clickable elements with icons
+    "buttons": ", ".join([
+        "button",
+        '[role="button"]',
+        'input[type="submit"]',
+        'input[type="button"]',
+        "a.button", "a.btn",
+        'a[class*="cart"]', 'a[class*="basket"]', 'a[class*="корзин"]',
+        'a[href*="cart"]', 'a[href*="basket"]', 'a[href*="checkout"]',
+        '[class*="CartButton"]', '[class*="cart-button"]', '[class*="basket-button"]',
+        'div[class*="cart"][onclick]', 'div[class*="basket"][onclick]',
+        "[onclick]:not(a):not(button)",
+    ]),
+    "inputs": 'input:not([type="hidden"]):not([type="submit"]):not([type="button"]), textarea, select',
+    "links": "a[href]",
+}
 
 
 @tool
@@ -32,15 +52,21 @@ async def browser_explore_page(
         limit: Maximum elements per category (default: 30)
 
     Returns:
-        JSON with discovered elements, each containing:
-        - type: "button" | "input" | "link" | "select" | "textarea"
+        JSON with discovered elements grouped by category (buttons, inputs,
+        links), each containing:
+        - type: "input" | "select" | "textarea" (inputs only - the category
+          already names buttons and links)
         - text: Visible text or label
         - selector: Recommended selector to use with browser tools
         - attributes: Relevant attributes (placeholder, name, type, href)
     """
-    include_buttons_js = "true" if include_buttons else "false"
-    include_inputs_js = "true" if include_inputs else "false"
-    include_links_js = "true" if include_links else "false"
+    included = {"buttons": include_buttons, "inputs": include_inputs, "links": include_links}
+    category_selectors = {
+        category: selector
+        for category, selector in _EXPLORE_SELECTORS.items()
+        if included[category]
+    }
+    union_selector = ", ".join(category_selectors.values())
 
     code_body = f"""
     const results = {{
@@ -51,320 +77,166 @@ async def browser_explore_page(
     }};
 
     const limit = {limit};
-    const includeButtons = {include_buttons_js};
-    const includeInputs = {include_inputs_js};
-    const includeLinks = {include_links_js};
-
-    function cleanText(text) {{
-      if (!text) return '';
-      return text
-        .replace(/\\xAD/g, '')  // Remove soft hyphens completely
-        .replace(/[\\u200B-\\u200D\\uFEFF\\xA0]/g, ' ')
-        .replace(/\\s+/g, ' ')
-        .trim()
-        .substring(0, 100);
-    }}
-
-    // Extract best available text from element (tries multiple sources)
-    function getBestText(el) {{
-      // 1. Try innerText (better for nested elements)
-      let text = (el.innerText || '').trim();
-      if (text && text.length > 0 && text.length < 200) return cleanText(text);
-
-      // 2. Try textContent
-      text = (el.textContent || '').trim();
-      if (text && text.length > 0 && text.length < 200) return cleanText(text);
-
-      // 3. Try aria-label
-      const ariaLabel = el.getAttribute('aria-label');
-      if (ariaLabel) return cleanText(ariaLabel);
-
-      // 4. Try title
-      const title = el.getAttribute('title');
-      if (title) return cleanText(title);
-
-      // 5. Try aria-labelledby
-      const labelledBy = el.getAttribute('aria-labelledby');
-      if (labelledBy) {{
-        const labelEl = document.getElementById(labelledBy);
-        if (labelEl) return cleanText(labelEl.textContent);
-      }}
-
-      // 6. For links, try to extract meaningful part from href
-      const href = el.getAttribute('href');
-      if (href) {{
-        if (href.includes('cart') || href.includes('basket') || href.includes('корзин')) return '[Cart/Корзина]';
-        if (href.includes('checkout')) return '[Checkout]';
-        if (href.includes('login') || href.includes('auth')) return '[Login]';
-      }}
-
-      return '';
-    }}
-
-    // Get class hints for debugging
-    function getClassHints(el) {{
-      const classes = el.className;
-      if (!classes || typeof classes !== 'string') return null;
-      // Return first 3 meaningful class names
-      const parts = classes.split(/\\s+/).filter(c => c.length > 2).slice(0, 3);
-      return parts.length > 0 ? parts.join(' ') : null;
-    }}
-
-    function getSelectorRecommendation(el, type) {{
-      // Priority: testid > role+name > placeholder > id > class
-      const testId = el.getAttribute('data-testid') || el.getAttribute('data-test-id');
-      if (testId) return `testid:${{testId}}`;
-
-      const ariaLabel = el.getAttribute('aria-label');
-      const text = cleanText(el.textContent || el.innerText);
-      const placeholder = el.getAttribute('placeholder');
-      const name = el.getAttribute('name');
-      const id = el.getAttribute('id');
-
-      // For buttons - prefer role:name
-      if (type === 'button' && text) {{
-        return `button:${{text}}`;
-      }}
-
-      // For links - prefer role:name
-      if (type === 'link' && text) {{
-        return `link:${{text}}`;
-      }}
-
-      // For inputs - prefer placeholder or label
-      if (type === 'input' || type === 'textarea' || type === 'select') {{
-        if (placeholder) return `placeholder:${{placeholder}}`;
-
-        // Try to find associated label
-        if (id) {{
-          const label = document.querySelector(`label[for="${{id}}"]`);
-          if (label) return `label:${{cleanText(label.textContent)}}`;
+    const categorySelectors = {json.dumps(category_selectors)};
+
+    // All categories in one evaluateAll over the union selector: one DOM
+    // query and one round-trip; each element is classified in the page
+    if (Object.keys(categorySelectors).length > 0) {{
+      const candidates = targetPage.locator({json.dumps(union_selector)});
+      const found = await candidates.evaluateAll((els, {{ limit, categorySelectors }}) => {{
+        {CLEAN_TEXT_JS}
+
+        // Same visibility rule as locator.isVisible(): non-empty box, not visibility:hidden
+        function isVisible(el) {{
+          const rect = el.getBoundingClientRect();
+          return rect.width && rect.height && getComputedStyle(el).visibility !== 'hidden';
         }}
 
-        if (ariaLabel) return `[aria-label="${{ariaLabel}}"]`;
-        if (name) return `[name="${{name}}"]`;
-      }}
-
-      // Fallback to id or generate CSS
-      if (id) return `#${{id}}`;
-
-      return null;
-    }}
-
-    // Discover buttons - expanded selector to catch more interactive elements
-    if (includeButtons) {{
-      // Extended selector: standard buttons + cart-like links + clickable elements with icons
-      const buttons = targetPage.locator(`
-        button,
-        [role="button"],
-        input[type="submit"],
-        input[type="button"],
-        a.button, a.btn,
-        a[class*="cart"], a[class*="basket"], a[class*="корзин"],
-        a[href*="cart"], a[href*="basket"], a[href*="checkout"],
-        [class*="CartButton"], [class*="cart-button"], [class*="basket-button"],
-        div[class*="cart"][onclick], div[class*="basket"][onclick],
-        [onclick]:not(a):not(button)
-      `.replace(/\\s+/g, ' '));
-      const count = await buttons.count();
-
-      for (let i = 0; i < Math.min(count, limit); i++) {{
-        try {{
-          const el = buttons.nth(i);
-          const isVisible = await el.isVisible().catch(() => false);
-          if (!isVisible) continue;
-
-          const type = await el.getAttribute('type').catch(() => null);
-          const href = await el.getAttribute('href').catch(() => null);
-
-          // Get element handle for better text extraction and selector
-          const handle = await el.elementHandle().catch(() => null);
-          let text = '';
-          let selector = null;
-          let classHints = null;
-
-          if (handle) {{
-            // Use getBestText for robust text extraction
-            const extracted = await targetPage.evaluate((el) => {{
-              // getBestText implementation inline for evaluate context
-              let text = (el.innerText || '').trim();
-              if (text && text.length > 0 && text.length < 200) {{
-                text = text.replace(/\\xAD/g, '').replace(/[\\u200B-\\u200D\\uFEFF\\xA0]/g, ' ').replace(/\\s+/g, ' ').trim().substring(0, 100);
-              }} else {{
-                text = (el.textContent || '').trim();
-                if (text && text.length > 0 && text.length < 200) {{
-                  text = text.replace(/\\xAD/g, '').replace(/[\\u200B-\\u200D\\uFEFF\\xA0]/g, ' ').replace(/\\s+/g, ' ').trim().substring(0, 100);
-                }} else {{
-                  text = '';
-                }}
-              }}
-
-              const ariaLabel = el.getAttribute('aria-label');
-              if (!text && ariaLabel) text = ariaLabel;
-
-              const title = el.getAttribute('title');
-              if (!text && title) text = title;
+        function describeButton(el) {{
+          const href = el.getAttribute('href');
 
-              // For empty text, try to infer from href
-              const href = el.getAttribute('href');
-              if (!text && href) {{
-                if (href.includes('cart') || href.includes('basket') || href.includes('корзин')) text = '[Cart/Корзина]';
-                else if (href.includes('checkout')) text = '[Checkout]';
-              }}
+          let text = (el.innerText || '').trim();
+          if (!text || text.length >= 200) {{
+            text = (el.textContent || '').trim();
+            if (text.length >= 200) text = '';
+          }}
+          text = cleanText(text).substring(0, 100);
 
-              // Get selector
-              const testId = el.getAttribute('data-testid') || el.getAttribute('data-test-id');
-              let selector = null;
-              if (testId) {{
-                selector = `testid:${{testId}}`;
-              }} else if (text && text.length > 0 && !text.startsWith('[')) {{
-                selector = `button:${{text.substring(0, 50)}}`;
-              }} else if (ariaLabel) {{
-                selector = `[aria-label="${{ariaLabel}}"]`;
-              }} else {{
-                const id = el.getAttribute('id');
-                if (id) selector = `#${{id}}`;
-              }}
+          const ariaLabel = el.getAttribute('aria-label');
+          if (!text && ariaLabel) text = ariaLabel;
 
-              // Get class hints for debugging
-              const classes = el.className;
-              let classHints = null;
-              if (classes && typeof classes === 'string') {{
-                const parts = classes.split(/\\s+/).filter(c => c.length > 2).slice(0, 3);
-                if (parts.length > 0) classHints = parts.join(' ');
-              }}
+          const title = el.getAttribute('title');
+          if (!text && title) text = title;
 
-              return {{ text: text || '[no text]', selector, classHints }};
-            }}, handle);
+          // For empty text, try to infer from href
+          if (!text && href) {{
+            if (href.includes('cart') || href.includes('basket') || href.includes('корзин')) text = '[Cart/Корзина]';
+            else if (href.includes('checkout')) text = '[Checkout]';
+          }}
+          if (!text) text = '[no text]';
 
-            text = extracted.text;
-            selector = extracted.selector;
-            classHints = extracted.classHints;
+          // Get selector: testid > stable id (CSS, cheapest to resolve) > role+name
+          // Ids with digits are usually generated per render and not reused
+          const testId = el.getAttribute('data-testid') || el.getAttribute('data-test-id');
+          let selector = null;
+          if (testId) {{
+            selector = `testid:${{testId}}`;
+          }} else if (/^[A-Za-z][A-Za-z_-]*$/.test(el.id)) {{
+            selector = `#${{el.id}}`;
+          }} else if (text !== '[no text]' && !text.startsWith('[')) {{
+            selector = `button:${{text.substring(0, 50)}}`;
+          }} else if (ariaLabel) {{
+            selector = `[aria-label="${{ariaLabel}}"]`;
+          }} else if (el.id) {{
+            selector = `#${{el.id}}`;
           }}
 
           // Include element if it has selector OR text OR is a cart-like element
           const isCartLike = href && (href.includes('cart') || href.includes('basket') || href.includes('checkout'));
-          if (selector || (text && text !== '[no text]') || isCartLike) {{
-            const attrs = {{ type }};
-            if (href) attrs.href = href.substring(0, 80);
-            if (classHints && text === '[no text]') attrs.classHints = classHints;
-
-            results.buttons.push({{
-              type: 'button',
-              text: text,
-              selector: selector,
-              attributes: attrs
-            }});
+          if (!selector && text === '[no text]' && !isCartLike) return null;
+
+          const attrs = {{ type: el.getAttribute('type') }};
+          if (href) attrs.href = href.substring(0, 80);
+          if (text === '[no text]' && typeof el.className === 'string') {{
+            // Class hints for debugging elements without text
+            const parts = el.className.split(/\\s+/).filter(c => c.length > 2).slice(0, 3);
+            if (parts.length > 0) attrs.classHints = parts.join(' ');
           }}
-        }} catch (e) {{
-          // Skip problematic elements
+
+          return {{ text, selector, attributes: attrs }};
         }}
-      }}
-      results.summary.buttons = results.buttons.length;
-    }}
 
-    // Discover inputs
-    if (includeInputs) {{
-      const inputs = targetPage.locator('input:not([type="hidden"]):not([type="submit"]):not([type="button"]), textarea, select');
-      const count = await inputs.count();
-
-      for (let i = 0; i < Math.min(count, limit); i++) {{
-        try {{
-          const el = inputs.nth(i);
-          const isVisible = await el.isVisible().catch(() => false);
-          if (!isVisible) continue;
-
-          const tagName = await el.evaluate(e => e.tagName.toLowerCase()).catch(() => 'input');
-          const inputType = await el.getAttribute('type').catch(() => 'text');
-          const placeholder = await el.getAttribute('placeholder').catch(() => null);
-          const name = await el.getAttribute('name').catch(() => null);
-          const ariaLabel = await el.getAttribute('aria-label').catch(() => null);
-          const id = await el.getAttribute('id').catch(() => null);
-
-          // Try to find label
-          let labelText = null;
-          if (id) {{
-            const label = await targetPage.locator(`label[for="${{id}}"]`).first().textContent().catch(() => null);
-            if (label) labelText = cleanText(label);
+        // label[for] texts are indexed once instead of a label lookup per input
+        let labelsByFor = null;
+        function describeInput(el) {{
+          if (labelsByFor === null) {{
+            labelsByFor = new Map();
+            for (const label of document.querySelectorAll('label[for]')) {{
+              if (!labelsByFor.has(label.htmlFor)) labelsByFor.set(label.htmlFor, label.textContent || '');
+            }}
           }}
 
-          // Determine selector
-          let selector = null;
-          const handle = await el.elementHandle().catch(() => null);
-          if (handle) {{
-            selector = await targetPage.evaluate((el) => {{
-              const testId = el.getAttribute('data-testid') || el.getAttribute('data-test-id');
-              if (testId) return `testid:${{testId}}`;
-
-              const placeholder = el.getAttribute('placeholder');
-              if (placeholder) return `placeholder:${{placeholder}}`;
-
-              const id = el.getAttribute('id');
-              if (id) {{
-                const label = document.querySelector(`label[for="${{id}}"]`);
-                if (label) return `label:${{(label.textContent || '').trim().substring(0, 50)}}`;
-              }}
-
-              const ariaLabel = el.getAttribute('aria-label');
-              if (ariaLabel) return `[aria-label="${{ariaLabel}}"]`;
-
-              const name = el.getAttribute('name');
-              if (name) return `[name="${{name}}"]`;
+          const tagName = el.tagName.toLowerCase();
+          const inputType = el.getAttribute('type');
+          const placeholder = el.getAttribute('placeholder');
+          const name = el.getAttribute('name');
+          const ariaLabel = el.getAttribute('aria-label');
+          const id = el.getAttribute('id');
 
-              if (id) return `#${{id}}`;
+          const label = id ? labelsByFor.get(id) : undefined;
+          const labelText = label ? cleanText(label).substring(0, 100) : null;
 
-              return null;
-            }}, handle);
-          }}
+          // Determine selector: testid > stable id > placeholder/label/attributes
+          const testId = el.getAttribute('data-testid') || el.getAttribute('data-test-id');
+          let selector = null;
+          if (testId) selector = `testid:${{testId}}`;
+          else if (id && /^[A-Za-z][A-Za-z_-]*$/.test(id)) selector = `#${{id}}`;
+          else if (placeholder) selector = `placeholder:${{placeholder}}`;
+          else if (label !== undefined) selector = `label:${{label.trim().substring(0, 50)}}`;
+          else if (ariaLabel) selector = `[aria-label="${{ariaLabel}}"]`;
+          else if (name) selector = `[name="${{name}}"]`;
+          else if (id) selector = `#${{id}}`;
 
           const displayName = labelText || placeholder || ariaLabel || name || `[${{tagName}}]`;
+          if (!selector && displayName === `[${{tagName}}]`) return null;
+
+          return {{
+            type: tagName === 'select' ? 'select' : (tagName === 'textarea' ? 'textarea' : 'input'),
+            text: displayName,
+            selector: selector,
+            attributes: {{
+              inputType: tagName === 'input' ? inputType : null,
+              placeholder,
+              name
+            }}
+          }};
+        }}
 
-          if (selector || displayName !== `[${{tagName}}]`) {{
-            results.inputs.push({{
-              type: tagName === 'select' ? 'select' : (tagName === 'textarea' ? 'textarea' : 'input'),
-              text: displayName,
-              selector: selector,
-              attributes: {{
-                inputType: tagName === 'input' ? inputType : null,
-                placeholder,
-                name
-              }}
-            }});
-          }}
-        }} catch (e) {{
-          // Skip problematic elements
+        function describeLink(el) {{
+          const text = cleanText(el.textContent).substring(0, 100);
+          if (text.length <= 1) return null;
+          const href = el.getAttribute('href');
+          return {{
+            text: text,
+            selector: `link:${{text}}`,
+            attributes: {{ href: href ? href.substring(0, 100) : null }}
+          }};
         }}
-      }}
-      results.summary.inputs = results.inputs.length;
-    }}
 
-    // Discover links (optional, usually too many)
-    if (includeLinks) {{
-      const links = targetPage.locator('a[href]');
-      const count = await links.count();
-
-      for (let i = 0; i < Math.min(count, limit); i++) {{
-        try {{
-          const el = links.nth(i);
-          const isVisible = await el.isVisible().catch(() => false);
-          if (!isVisible) continue;
-
-          const text = cleanText(await el.textContent().catch(() => ''));
-          const href = await el.getAttribute('href').catch(() => null);
-
-          if (text && text.length > 1) {{
-            results.links.push({{
-              type: 'link',
-              text: text,
-              selector: `link:${{text}}`,
-              attributes: {{ href: href ? href.substring(0, 100) : null }}
-            }});
+        const describers = {{ buttons: describeButton, inputs: describeInput, links: describeLink }};
+        const categories = Object.keys(categorySelectors);
+        const buckets = {{}};
+        const seen = {{}};
+        for (const category of categories) {{
+          buckets[category] = [];
+          seen[category] = 0;
+        }}
+
+        for (const el of els) {{
+          let visible = null;
+          for (const category of categories) {{
+            // The first `limit` matches of each category are considered,
+            // as with a separate query per category
+            if (seen[category] >= limit || !el.matches(categorySelectors[category])) continue;
+            seen[category]++;
+            try {{
+              if (visible === null) visible = isVisible(el);
+              if (!visible) continue;
+              const item = describers[category](el);
+              if (item) buckets[category].push(item);
+            }} catch (e) {{
+              // Skip problematic elements
+            }}
           }}
-        }} catch (e) {{
-          // Skip problematic elements
+          if (categories.every(category => seen[category] >= limit)) break;
         }}
+        return buckets;
+      }}, {{ limit, categorySelectors }});
+
+      for (const category of Object.keys(found)) {{
+        results[category] = found[category];
+        results.summary[category] = found[category].length;
       }}
-      results.summary.links = results.links.length;
     }}
 
     return JSON.stringify({{
@@ -379,7 +251,7 @@ async def browser_explore_page(
 
     try:
         parsed = json.loads(result)
-        return json.dumps(parsed, ensure_ascii=False, indent=2)
+        return json.dumps(parsed, ensure_ascii=False)
     except json.JSONDecodeError:
         return json.dumps(
             {"success": False, "error": f"Invalid response: {result}"},
@@ -435,112 +307,13 @@ async def browser_inspect_container(
     const includeText = {str(include_text).lower()};
     const maxChildren = {max_children};
 
-    const count = await locator.count();
-
-    if (count === 0) {{
-      return JSON.stringify({{
-        success: false,
-        error: 'No elements found matching the selector',
-        suggestion: 'Try a broader selector like "div", "[class*=\\'cart\\']", or use browser_explore_page first'
-      }});
-    }}
-
-    function cleanText(text) {{
-      if (!text) return '';
-      return text
-        .replace(/\\xAD/g, '')
-        .replace(/[\\u200B-\\u200D\\uFEFF\\xA0]/g, ' ')
-        .replace(/\\s+/g, ' ')
-        .trim()
-        .substring(0, 100);
-    }}
-
-    function getClassList(el) {{
-      const classes = el.className;
-      if (!classes || typeof classes !== 'string') return [];
-      return classes.split(/\\s+/).filter(c => c.length > 0);
-    }}
-
-    function inspectElement(el, currentDepth) {{
-      const tag = el.tagName.toLowerCase();
-      const classes = getClassList(el);
-      const id = el.id || null;
-
-      const result = {{
-        tag: tag,
-      }};
-
-      if (id) result.id = id;
-      if (classes.length > 0) result.classes = classes;
-
-      // Add useful attributes
-      const href = el.getAttribute('href');
-      const dataTestId = el.getAttribute('data-testid') || el.getAttribute('data-test-id');
-      if (href) result.href = href.substring(0, 80);
-      if (dataTestId) result.testId = dataTestId;
-
-      // Add text content (direct text, not from children)
-      if (includeText) {{
-        // Get only direct text nodes
-        let directText = '';
-        for (const node of el.childNodes) {{
-          if (node.nodeType === Node.TEXT_NODE) {{
-            directText += node.textContent;
-          }}
-        }}
-        directText = cleanText(directText);
-        if (directText) result.text = directText;
-
-        // Also get full innerText for leaf nodes
-        if (el.children.length === 0) {{
-          const fullText = cleanText(el.innerText);
-          if (fullText && fullText !== directText) {{
-            result.text = fullText;
-          }}
-        }}
-      }}
-
-      // Recurse into children
-      if (currentDepth < maxDepth && el.children.length > 0) {{
-        const children = [];
-        const childCount = Math.min(el.children.length, maxChildren);
-        for (let i = 0; i < childCount; i++) {{
-          children.push(inspectElement(el.children[i], currentDepth + 1));
-        }}
-        if (children.length > 0) {{
-          result.children = children;
-          if (el.children.length > maxChildren) {{
-            result.moreChildren = el.children.length - maxChildren;
-          }}
-        }}
-      }} else if (el.children.length > 0) {{
-        result.childCount = el.children.length;
-      }}
+    // Count and inspect the first match in one evaluateAll: no element
+    // handle is created, so nothing is left alive on the page side
+    const [count, structure] = await locator.evaluateAll(
+      (els, {{ maxDepth, includeText, maxChildren }}) => {{
+        if (els.length === 0) return [0, null];
 
-      return result;
-    }}
-
-    // Inspect first matching element
-    const handle = await locator.first().elementHandle();
-    if (!handle) {{
-      return JSON.stringify({{
-        success: false,
-        error: 'Could not get element handle'
-      }});
-    }}
-
-    const structure = await targetPage.evaluate(
-      ({{ el, maxDepth, includeText, maxChildren }}) => {{
-        // Re-define functions inside evaluate context
-        function cleanText(text) {{
-          if (!text) return '';
-          return text
-            .replace(/\\xAD/g, '')
-            .replace(/[\\u200B-\\u200D\\uFEFF\\xA0]/g, ' ')
-            .replace(/\\s+/g, ' ')
-            .trim()
-            .substring(0, 100);
-        }}
+        {CLEAN_TEXT_JS}
 
         function getClassList(el) {{
           const classes = el.className;
@@ -570,11 +343,11 @@ async def browser_inspect_container(
                 directText += node.textContent;
               }}
             }}
-            directText = cleanText(directText);
+            directText = cleanText(directText).substring(0, 100);
             if (directText) result.text = directText;
 
             if (el.children.length === 0) {{
-              const fullText = cleanText(el.innerText);
+              const fullText = cleanText(el.innerText).substring(0, 100);
               if (fullText && fullText !== directText) {{
                 result.text = fullText;
               }}
@@ -600,11 +373,19 @@ async def browser_inspect_container(
           return result;
         }}
 
-        return inspectElement(el, 0);
+        return [els.length, inspectElement(els[0], 0)];
       }},
-      {{ el: handle, maxDepth, includeText, maxChildren }}
+      {{ maxDepth, includeText, maxChildren }}
     );
 
+    if (count === 0) {{
+      return JSON.stringify({{
+        success: false,
+        error: 'No elements found matching the selector',
+        suggestion: 'Try a broader selector like "div", "[class*=\\'cart\\']", or use browser_explore_page first'
+      }});
+    }}
+
     return JSON.stringify({{
       success: true,
       matchCount: count,
@@ -618,7 +399,7 @@ async def browser_inspect_container(
 
     try:
         parsed = json.loads(result)
-        return json.dumps(parsed, ensure_ascii=False, indent=2)
+        return json.dumps(parsed, ensure_ascii=False)
     except json.JSONDecodeError:
         return json.dumps(
             {"success": False, "error": f"Invalid response: {result}"},
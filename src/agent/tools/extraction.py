@@ -6,12 +6,15 @@ operations will automatically target the correct page.
 """
 
 import json
+import re
 
 from langchain_core.tools import tool
 
 from src.agent.tools._executor import BrowserExecutor
 from src.agent.tools._selectors import target_to_locator_js
-from src.agent.tools._templates import build_async_function
+from src.agent.tools._templates import CLEAN_TEXT_JS, build_async_function
+
+_ATTRIBUTE_NAME_RE = re.compile(r"[\w:.-]+")
 
 
 @tool
@@ -51,15 +54,6 @@ async def browser_get_text(
     all_matches_js = "true" if all_matches else "false"
 
     code_body = f"""
-    function cleanText(text) {{
-      if (!text) return '';
-      return text
-        .replace(/\\xAD/g, '')  // Remove soft hyphens completely
-        .replace(/[\\u200B-\\u200D\\uFEFF\\xA0]/g, ' ')
-        .replace(/\\s+/g, ' ')
-        .trim();
-    }}
-
     const locator = {locator_js};
     const allMatches = {all_matches_js};
     const limit = {limit};
@@ -75,14 +69,14 @@ async def browser_get_text(
     }}
 
     if (allMatches) {{
-      // Extract text from multiple elements
-      const texts = [];
+      // Extract text from multiple elements in one round-trip
+      // (evaluateAll instead of N sequential nth(i).textContent() calls)
       const extractCount = Math.min(count, limit);
-
-      for (let i = 0; i < extractCount; i++) {{
-        const text = await locator.nth(i).textContent();
-        texts.push(cleanText(text));
-      }}
+      const rawTexts = await locator.evaluateAll(
+        (els, max) => els.slice(0, max).map(el => el.textContent),
+        extractCount
+      );
+      const texts = rawTexts.map(cleanText);
 
       return JSON.stringify({{
         success: true,
@@ -102,6 +96,105 @@ async def browser_get_text(
     }}
 """
 
+    code = build_async_function(code_body, helpers=["cleanText"], use_target_page=True)
+    result = await BrowserExecutor.execute(code)
+
+    try:
+        parsed = json.loads(result)
+        return json.dumps(parsed, ensure_ascii=False)
+    except json.JSONDecodeError:
+        return json.dumps(
+            {"success": False, "error": f"Invalid response: {result}"},
+            ensure_ascii=False,
+        )
+
+
+@tool
+async def browser_get_list(target: str, fields: dict[str, str], limit: int = 50) -> str:
+    """
+    Extract structured data from a list of repeated elements in one call.
+
+    Use for product cards, search results, table rows - anything where each
+    item has the same parts. All items are read in a single pass on the page,
+    much faster than calling browser_get_text for every field.
+    Automatically operates on the current target tab.
+
+    Args:
+        target: Selector of the repeated item (any supported target format),
+                e.g. ".product-card", "listitem", "tr"
+        fields: Mapping of output field name to a CSS selector inside the item.
+                Append "@attribute" to read an attribute instead of text;
+                use "" (or just "@attribute") for the item element itself.
+                Example: {"title": "h3", "price": ".price", "url": "a@href"}
+        limit: Maximum number of items to extract (default: 50)
+
+    Returns:
+        JSON string with:
+        - success: bool
+        - items: list of {field: value} (value is null if the part is missing)
+        - count: int (number of matching items)
+        - extracted: int (number of items returned)
+        - error: str (only if success=false)
+    """
+    if not fields:
+        return json.dumps(
+            {"success": False, "error": "fields must contain at least one field"},
+            ensure_ascii=False,
+        )
+
+    columns = []
+    for name, spec in fields.items():
+        selector, sep, attribute = spec.rpartition("@")
+        if not sep or not _ATTRIBUTE_NAME_RE.fullmatch(attribute):
+            selector, attribute = spec, None
+        columns.append([name, selector.strip(), attribute])
+
+    locator_js = target_to_locator_js(target, page_var="targetPage")
+    columns_js = json.dumps(columns, ensure_ascii=False)
+
+    code_body = f"""
+    const locator = {locator_js};
+    const columns = {columns_js};
+    const limit = {limit};
+
+    const count = await locator.count();
+
+    if (count === 0) {{
+      return JSON.stringify({{
+        success: false,
+        error: 'No elements found matching the selector',
+        count: 0
+      }});
+    }}
+
+    // All rows and columns in one evaluateAll round-trip
+    const items = await locator.evaluateAll((rows, {{ columns, limit }}) => {{
+      {CLEAN_TEXT_JS}
+      return rows.slice(0, limit).map(row => {{
+        const item = {{}};
+        for (const [name, selector, attribute] of columns) {{
+          const el = selector ? row.querySelector(selector) : row;
+          if (!el) {{
+            item[name] = null;
+          }} else if (attribute) {{
+            const value = el.getAttribute(attribute);
+            item[name] = value === null ? null : cleanText(value);
+          }} else {{
+            item[name] = cleanText(el.textContent);
+          }}
+        }}
+        return item;
+      }});
+    }}, {{ columns, limit }});
+
+    return JSON.stringify({{
+      success: true,
+      items: items,
+      count: count,
+      extracted: items.length
+    }});
+"""
+
     code = build_async_function(code_body, use_target_page=True)
     result = await BrowserExecutor.execute(code)
 
@@ -142,19 +235,14 @@ async def browser_get_attribute(target: str, attribute: str) -> str:
     escaped_attr = attribute.replace("'", "\\'")
 
     code_body = f"""
-    function cleanText(text) {{
-      if (!text) return text;
-      return text
-        .replace(/\\xAD/g, '')  // Remove soft hyphens completely
-        .replace(/[\\u200B-\\u200D\\uFEFF\\xA0]/g, ' ')
-        .replace(/\\s+/g, ' ')
-        .trim();
-    }}
-
     const locator = {locator_js};
     const attributeName = '{escaped_attr}';
 
-    const count = await locator.count();
+    // Count and read the first match in one round-trip
+    const [count, value] = await locator.evaluateAll(
+      (els, name) => [els.length, els.length ? els[0].getAttribute(name) : null],
+      attributeName
+    );
 
     if (count === 0) {{
       return JSON.stringify({{
@@ -163,15 +251,13 @@ async def browser_get_attribute(target: str, attribute: str) -> str:
       }});
     }}
 
-    const value = await locator.first().getAttribute(attributeName);
-
     return JSON.stringify({{
       success: true,
       value: value ? cleanText(value) : null
     }});
 """
 
-    code = build_async_function(code_body, use_target_page=True)
+    code = build_async_function(code_body, helpers=["cleanText"], use_target_page=True)
     result = await BrowserExecutor.execute(code)
 
     try:
@@ -1,5 +1,8 @@
 """Fallback browser tool for custom Playwright code."""
 
+import json
+import re
+
 from langchain_core.tools import tool
 
 from src.agent.tools._executor import BrowserExecutor
@@ -7,6 +10,112 @@ from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Fixed waits longer than this are rejected - wait for a condition instead
+_MAX_FIXED_WAIT_MS = 2000
+
+_GET_BY_ROLE_ARRAY_RE = re.compile(r"getByRole\(\s*\[")
+_WAIT_FOR_TIMEOUT_RE = re.compile(r"waitForTimeout\(\s*(\d+)")
+# 'networkidle' passed as a load state or waitUntil option (not any mention)
+_NETWORKIDLE_RE = re.compile(
+    r"""waitForLoadState\(\s*['"`]networkidle['"`]|waitUntil\s*:\s*['"`]networkidle['"`]"""
+)
+_TIMEOUT_OPTION_RE = re.compile(r"\btimeout\s*:\s*([\w.]+)")
+_LINE_COMMENT_RE = re.compile(r"^\s*//.*$", re.MULTILINE)
+# The browser and its context belong to the user's session, not to tool code
+_LIFECYCLE_RE = re.compile(r"\b(?:browser|context)(?:\(\))?\.close\(|\.launch\w*\(")
+
+
+def _lint_custom_code(code: str) -> list[str]:
+    """
+    Statically check custom code for known Playwright mistakes.
+
+    Catches patterns that would fail or hang at runtime before the code
+    is sent to the browser, so the agent gets a short, specific error
+    instead of a timeout.
+
+    Args:
+        code: User's async (page) => { ... } code
+
+    Returns:
+        List of issue descriptions (empty if the code looks fine)
+    """
+    issues = []
+
+    if _GET_BY_ROLE_ARRAY_RE.search(code):
+        issues.append(
+            "getByRole takes a role string, not an array: "
+            "getByRole('button', { name: 'Submit' })"
+        )
+
+    for match in _WAIT_FOR_TIMEOUT_RE.finditer(code):
+        if int(match.group(1)) > _MAX_FIXED_WAIT_MS:
+            issues.append(
+                f"waitForTimeout({match.group(1)}) is a long fixed delay - wait for "
+                "a condition instead (locator.waitFor, page.waitForURL)"
+            )
+            break
+
+    for match in _NETWORKIDLE_RE.finditer(_LINE_COMMENT_RE.sub("", code)):
+        timeout = _call_timeout(match.string, match.end())
+        if timeout is None or timeout > _MAX_FIXED_WAIT_MS:
+            issues.append(
+                "'networkidle' without a short timeout may never settle on SPA pages - "
+                f"pass timeout <= {_MAX_FIXED_WAIT_MS}, wait for a specific element, "
+                "or use browser_wait_for_load(state='networkidle') which is bounded"
+            )
+            break
+
+    if _LIFECYCLE_RE.search(code):
+        issues.append(
+            "Don't launch or close the browser/context - it is the user's shared "
+            "session. Open pages with page.context().newPage() if needed"
+        )
+
+    return issues
+
+
+def _call_timeout(code: str, pos: int) -> int | None:
+    """
+    Find the literal timeout option of the call enclosing position pos.
+
+    Args:
+        code: Custom code
+        pos: Index inside the call's arguments
+
+    Returns:
+        Timeout in ms, 0 for a non-literal timeout (can't be judged, treated
+        as bounded), or None if the call has no timeout option
+    """
+    # Walk back to the unclosed "(" of the enclosing call
+    depth = 0
+    start = pos
+    while start > 0:
+        start -= 1
+        if code[start] == ")":
+            depth += 1
+        elif code[start] == "(":
+            if depth == 0:
+                break
+            depth -= 1
+
+    # Walk forward to its matching ")"
+    depth = 0
+    end = start
+    while end < len(code):
+        if code[end] == "(":
+            depth += 1
+        elif code[end] == ")":
+            depth -= 1
+            if depth == 0:
+                break
+        end += 1
+
+    match = _TIMEOUT_OPTION_RE.search(code, start, end)
+    if match is None:
+        return None
+    value = match.group(1)
+    return int(value) if value.isdigit() else 0
+
 
 def _wrap_with_target_page(user_code: str) -> str:
     """
@@ -77,14 +186,29 @@ async def browser_run_custom(code: str, description: str) -> str:
         Result of code execution (string or JSON stringified result)
 
     Note:
+        Code is checked before execution and rejected with an "issues" list
+        if it uses getByRole with an array, waitForTimeout over 2000 ms,
+        a 'networkidle' wait without a timeout (or with one over 2000 ms),
+        or launches/closes the browser or context.
         The code receives `page` as Playwright Page object with full API.
-        Always return a result (use JSON.stringify for objects).
+        Use locator.fill() for text input; type()/pressSequentially() send
+        one key event per character and are only needed for key handlers.
+        Always return a result. Return strings and numbers directly
+        (return title); use JSON.stringify only for objects and arrays.
         Wrap code in try-catch for error handling.
 
         MULTI-TAB: Your code automatically receives the correct target page.
         The `page` parameter will point to the page matching the current
         target URL pattern (set by browser_navigate), not MCP's internal tab.
     """
+    issues = _lint_custom_code(code)
+    if issues:
+        logger.info(f"Rejected custom Playwright code: {description} - {issues}")
+        return json.dumps(
+            {"success": False, "error": "Code rejected before execution", "issues": issues},
+            ensure_ascii=False,
+        )
+
     logger.info(f"Executing custom Playwright code: {description}")
 
     # Wrap user code to automatically use target page
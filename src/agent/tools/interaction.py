@@ -50,7 +50,12 @@ async def browser_click(target: str, verify: bool = True) -> str:
     const locator = {locator_js};
     const shouldVerify = {verify_js};
 
-    const count = await locator.count();
+    // Match count and enabled state of the first match in one round-trip
+    // (disabled: native/fieldset :disabled or aria-disabled, as isEnabled() checks)
+    const [count, isDisabled] = await locator.evaluateAll(els => [
+      els.length,
+      els.length > 0 && (els[0].matches(':disabled') || !!els[0].closest('[aria-disabled="true"]'))
+    ]);
 
     if (count === 0) {{
       return JSON.stringify({{
@@ -64,9 +69,7 @@ async def browser_click(target: str, verify: bool = True) -> str:
     const urlBefore = targetPage.url();
     const element = locator.first();
 
-    // Check if element is enabled
-    const isEnabled = await element.isEnabled();
-    if (!isEnabled) {{
+    if (isDisabled) {{
       return JSON.stringify({{
         success: false,
         error: 'Element is disabled and cannot be clicked',
@@ -74,13 +77,11 @@ async def browser_click(target: str, verify: bool = True) -> str:
       }});
     }}
 
-    // Scroll element into view before clicking
-    await element.scrollIntoViewIfNeeded();
-    await targetPage.waitForTimeout(200);
-
+    // click() scrolls into view and retries actionability checks on its own -
+    // no manual scroll or settle delay needed.
     // Perform click with force option to bypass overlay checks if needed
     try {{
-      await element.click({{ timeout: 10000 }});
+      await element.click();
     }} catch (clickError) {{
       // If normal click fails, try with force (bypasses actionability checks)
       if (clickError.message.includes('intercept') || clickError.message.includes('outside')) {{
@@ -90,25 +91,22 @@ async def browser_click(target: str, verify: bool = True) -> str:
       }}
     }}
 
-    // Small wait for any reactions
-    await targetPage.waitForTimeout(500);
-
-    // Check if URL changed
-    const urlAfter = targetPage.url();
-    const urlChanged = urlBefore !== urlAfter;
+    // Wait for the URL change itself instead of fixed sleeps: resolves as soon
+    // as navigation commits, gives up after the same budget the sleeps used
+    const urlChanged = await targetPage
+      .waitForURL(url => url.toString() !== urlBefore, {{
+        timeout: shouldVerify ? 1500 : 500,
+        waitUntil: 'commit'
+      }})
+      .then(() => true, () => false);
 
     if (shouldVerify && !urlChanged) {{
-      // Wait a bit more and check again (for SPA navigation)
-      await targetPage.waitForTimeout(1000);
-      const urlFinal = targetPage.url();
-      const finalUrlChanged = urlBefore !== urlFinal;
-
       return JSON.stringify({{
         success: true,
         clicked: true,
-        url_changed: finalUrlChanged,
-        verified: finalUrlChanged,
-        note: finalUrlChanged ? undefined : 'Click executed but no URL change detected. This may be normal for some interactions.'
+        url_changed: false,
+        verified: false,
+        note: 'Click executed but no URL change detected. This may be normal for some interactions.'
       }});
     }}
 
@@ -138,7 +136,8 @@ async def browser_fill(target: str, text: str, submit: bool = False) -> str:
     """
     Fill text into an input field.
 
-    Clears existing content and types new text.
+    Clears existing content and sets the new value in one step (locator.fill,
+    not per-character typing), so long text costs no more than short text.
     Automatically operates on the current target tab.
 
     Target formats:
@@ -185,10 +184,13 @@ async def browser_fill(target: str, text: str, submit: bool = False) -> str:
 
     let submitted = false;
     if (shouldSubmit) {{
+      const urlBefore = targetPage.url();
       await element.press('Enter');
       submitted = true;
-      // Wait for any navigation or loading
-      await targetPage.waitForTimeout(1000);
+      // Return as soon as the submit navigates; same 1s budget as before otherwise
+      await targetPage
+        .waitForURL(url => url.toString() !== urlBefore, {{ timeout: 1000, waitUntil: 'commit' }})
+        .catch(() => {{}});
     }}
 
     return JSON.stringify({{
@@ -211,6 +213,119 @@ async def browser_fill(target: str, text: str, submit: bool = False) -> str:
         )
 
 
+@tool
+async def browser_fill_form(fields: dict[str, str], submit: Optional[str] = None) -> str:
+    """
+    Fill several input fields and optionally submit, in a single call.
+
+    Use this instead of a series of browser_fill calls when the fields are
+    already known (e.g. from browser_explore_page): every field is filled in
+    one browser round-trip and one agent step.
+    Automatically operates on the current target tab.
+
+    Args:
+        fields: Mapping of input selector to text, in fill order. Selectors
+                use the same formats as browser_fill, e.g.
+                {"placeholder:Email": "user@example.com", "label:Password": "secret"}
+        submit: Optional selector of a button to click after filling
+                (e.g. "button:Sign in")
+
+    Returns:
+        JSON string with:
+        - success: bool
+        - filled: list of selectors that were filled
+        - submitted: bool
+        - url_changed: bool (only if submit was given)
+        - url: str (page URL after the batch)
+        - error: str (only if success=false; names the failing selector)
+    """
+    if not fields:
+        return json.dumps(
+            {"success": False, "error": "fields must contain at least one selector"},
+            ensure_ascii=False,
+        )
+
+    # Values go in as JSON literals so newlines and quotes in multi-line
+    # textarea text can't break the generated code
+    steps = []
+    for target, text in fields.items():
+        locator_js = target_to_locator_js(target, page_var="targetPage")
+        steps.append(f"[{json.dumps(target)}, {locator_js}, {json.dumps(text)}]")
+    steps_js = ",\n      ".join(steps)
+
+    if submit:
+        submit_locator_js = target_to_locator_js(submit, page_var="targetPage")
+        submit_js = f"[{json.dumps(submit)}, {submit_locator_js}]"
+    else:
+        submit_js = "null"
+
+    code_body = f"""
+    const steps = [
+      {steps_js}
+    ];
+    const submitStep = {submit_js};
+    const filled = [];
+
+    for (const [target, locator, textToFill] of steps) {{
+      if (await locator.count() === 0) {{
+        return JSON.stringify({{
+          success: false,
+          error: `No input elements found matching the selector: ${{target}}`,
+          filled
+        }});
+      }}
+      await locator.first().fill(textToFill);
+      filled.push(target);
+    }}
+
+    if (!submitStep) {{
+      return JSON.stringify({{
+        success: true,
+        filled,
+        submitted: false,
+        url: targetPage.url()
+      }});
+    }}
+
+    const [submitTarget, submitLocator] = submitStep;
+    if (await submitLocator.count() === 0) {{
+      return JSON.stringify({{
+        success: false,
+        error: `No elements found matching the submit selector: ${{submitTarget}}`,
+        filled,
+        submitted: false
+      }});
+    }}
+
+    const urlBefore = targetPage.url();
+    await submitLocator.first().click();
+
+    const urlChanged = await targetPage
+      .waitForURL(url => url.toString() !== urlBefore, {{ timeout: 1500, waitUntil: 'commit' }})
+      .then(() => true, () => false);
+
+    return JSON.stringify({{
+      success: true,
+      filled,
+      submitted: true,
+      url_changed: urlChanged,
+      url: targetPage.url()
+    }});
+"""
+
+    code = build_async_function(code_body, use_target_page=True)
+    result = await BrowserExecutor.execute(code)
+
+    try:
+        parsed = json.loads(result)
+        return json.dumps(parsed, ensure_ascii=False)
+    except json.JSONDecodeError:
+        return json.dumps(
+            {"success": False, "error": f"Invalid response: {result}"},
+            ensure_ascii=False,
+        )
+
+
 @tool
 async def browser_press_key(key: str, target: Optional[str] = None) -> str:
     """
@@ -7,9 +7,47 @@ from langchain_core.tools import tool
 from src.agent.tools._executor import BrowserExecutor
 from src.agent.tools._templates import build_async_function
 
+# Resource types aborted when block_resources=True. Stylesheets are kept:
+# visibility checks in other tools rely on computed styles.
+_BLOCKED_RESOURCE_TYPES = ["image", "media", "font"]
+
+# Analytics/ad hosts aborted when block_resources=True (subdomains included).
+# Their beacons add bytes and keep the network busy long after DOM is ready.
+_BLOCKED_HOSTS = [
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "mc.yandex.ru",
+    "top-fwz1.mail.ru",
+    "facebook.net",
+]
+
+
+def _resource_blocking_js(page_var: str) -> str:
+    """Build JS that aborts heavy resource and tracker requests on a page."""
+    blocked_types = json.dumps(_BLOCKED_RESOURCE_TYPES)
+    blocked_hosts = json.dumps(_BLOCKED_HOSTS)
+    return f"""
+    const blockedTypes = {blocked_types};
+    const blockedHosts = {blocked_hosts};
+    await {page_var}.route('**/*', route => {{
+      const request = route.request();
+      if (blockedTypes.includes(request.resourceType())) {{
+        return route.abort();
+      }}
+      const host = new URL(request.url()).hostname;
+      if (blockedHosts.some(h => host === h || host.endsWith('.' + h))) {{
+        return route.abort();
+      }}
+      return route.continue();
+    }});
+"""
+
 
 @tool
-async def browser_navigate(url: str, new_tab: bool = True) -> str:
+async def browser_navigate(
+    url: str, new_tab: bool = True, block_resources: bool = False
+) -> str:
     """
     Navigate to a URL.
 
@@ -22,10 +60,18 @@ async def browser_navigate(url: str, new_tab: bool = True) -> str:
 
     Waits for DOM content loaded (fast, works with SPA).
 
+    Set block_resources=True for text/data extraction tasks: images, media,
+    fonts and known analytics/ad hosts are aborted, which makes heavy pages
+    load much faster.
+    Blocking stays active for the tab. Don't use it when the task needs
+    screenshots or the visual look of the page.
+
     Args:
         url: Full URL to navigate to (must include https:// or http://)
         new_tab: If True (default), creates a new tab for navigation.
                  If False, navigates in the current target tab.
+        block_resources: If True, abort image/media/font and tracker
+                         requests in the tab.
 
     Returns:
         JSON string with:
@@ -46,6 +92,7 @@ async def browser_navigate(url: str, new_tab: bool = True) -> str:
 
     // Create new page and navigate immediately
     const newPage = await page.context().newPage();
+    {_resource_blocking_js("newPage") if block_resources else ""}
     await newPage.goto(targetUrl, {{
       waitUntil: 'domcontentloaded',
       timeout: 15000
@@ -74,11 +121,9 @@ async def browser_navigate(url: str, new_tab: bool = True) -> str:
 
     {page_finder}
 
+    {_resource_blocking_js("targetPage") if block_resources else ""}
     // Navigate current target page
-    await targetPage.goto(targetUrl, {{
-      waitUntil: 'domcontentloaded',
-      timeout: 15000
-    }});
+    await targetPage.goto(targetUrl, {{ waitUntil: 'domcontentloaded' }});
 
     // Get tab index
     const pages = page.context().pages();
@@ -57,20 +57,32 @@ async def browser_close_modal(
       '[class*="overlay"]'
     ];
 
-    let modalFound = false;
-    let modal = null;
-
-    for (const selector of modalSelectors) {{
-      const elements = await targetPage.locator(selector).all();
-      for (const el of elements) {{
-        if (await el.isVisible()) {{
-          modalFound = true;
-          modal = el;
-          break;
+    // One round-trip for all selectors: query their union and pick the
+    // visible element that matches the highest-priority selector. Return its
+    // position within that selector only, so the locator below keeps pointing
+    // at the modal (not at the next union match) once it leaves the DOM.
+    const modalCandidates = targetPage.locator(modalSelectors.join(', '));
+    const best = await modalCandidates.evaluateAll((els, selectors) => {{
+      let bestEl = null;
+      let bestRank = selectors.length;
+      for (const el of els) {{
+        const rect = el.getBoundingClientRect();
+        if (!rect.width || !rect.height || getComputedStyle(el).visibility === 'hidden') continue;
+        const rank = selectors.findIndex(sel => el.matches(sel));
+        if (rank !== -1 && rank < bestRank) {{
+          bestEl = el;
+          bestRank = rank;
         }}
       }}
-      if (modalFound) break;
-    }}
+      if (!bestEl) return null;
+      // Union matches are in document order, same as the single-selector locator
+      const index = els.slice(0, els.indexOf(bestEl))
+        .filter(el => el.matches(selectors[bestRank])).length;
+      return {{ rank: bestRank, index }};
+    }}, modalSelectors);
+
+    const modalFound = best !== null;
+    const modal = modalFound ? targetPage.locator(modalSelectors[best.rank]).nth(best.index) : null;
 
     if (!modalFound) {{
       return JSON.stringify({{
@@ -80,6 +92,12 @@ async def browser_close_modal(
       }});
     }}
 
+    // Wait up to 500ms for the modal to disappear (same budget as the old
+    // fixed sleep, but returns as soon as the close animation is done)
+    const modalClosed = () => modal
+      .waitFor({{ state: 'hidden', timeout: 500 }})
+      .then(() => true, () => false);
+
     // Try strategies
     const strategies = strategy === 'auto'
       ? ['escape', 'click_close', 'click_backdrop']
@@ -89,10 +107,9 @@ async def browser_close_modal(
       try {{
         if (strat === 'escape') {{
           await targetPage.keyboard.press('Escape');
-          await targetPage.waitForTimeout(500);
 
-          // Check if modal closed
-          if (!await modal.isVisible()) {{
+          // Resolves as soon as the modal is gone instead of a fixed sleep
+          if (await modalClosed()) {{
             return JSON.stringify({{
               success: true,
               modal_found: true,
@@ -117,14 +134,20 @@ async def browser_close_modal(
             'button:has-text("Закрыть")'
           ];
 
-          for (const closeSelector of closeSelectors) {{
-            const closeBtn = targetPage.locator(closeSelector).first();
-            if (await closeBtn.count() > 0 && await closeBtn.isVisible()) {{
+          // Probe all candidates concurrently; isVisible() is false when
+          // nothing matches, so no separate count() probe is needed
+          const closeButtons = closeSelectors.map(sel => targetPage.locator(sel).first());
+          const visibleNow = await Promise.all(closeButtons.map(btn => btn.isVisible()));
+
+          let clicked = false;
+          for (let i = 0; i < closeButtons.length; i++) {{
+            const closeBtn = closeButtons[i];
+            // After a click the page may have changed - re-check before the next one
+            if (visibleNow[i] && (!clicked || await closeBtn.isVisible())) {{
+              clicked = true;
               await closeBtn.click({{ force: true }});
-              await targetPage.waitForTimeout(500);
 
-              // Check if modal closed
-              if (!await modal.isVisible()) {{
+              if (await modalClosed()) {{
                 return JSON.stringify({{
                   success: true,
                   modal_found: true,
@@ -143,11 +166,8 @@ async def browser_close_modal(
             const x = Math.max(10, box.x - 50);
             const y = box.y + box.height / 2;
             await targetPage.mouse.click(x, y);
-            await targetPage.waitForTimeout(500);
 
-            // Check if modal closed
-            const stillVisible = await modal.isVisible().catch(() => false);
-            if (!stillVisible) {{
+            if (await modalClosed()) {{
               return JSON.stringify({{
                 success: true,
                 modal_found: true,
@@ -320,7 +340,7 @@ async def browser_reload() -> str:
         - error: str (only if success=false)
     """
     code_body = """
-    await targetPage.reload({ waitUntil: 'domcontentloaded', timeout: 15000 });
+    await targetPage.reload({ waitUntil: 'domcontentloaded' });
 
     return JSON.stringify({
       success: true,
@@ -31,16 +31,20 @@ async def browser_list_tabs() -> str:
     """
     code_body = """
     const pages = page.context().pages();
-    const tabs = [];
 
-    for (let i = 0; i < pages.length; i++) {
-        const p = pages[i];
-        tabs.push({
+    // Titles are independent reads - fetch them concurrently.
+    // url() is local; blank tabs have no title, so skip their round-trip.
+    const tabs = await Promise.all(pages.map(async (p, i) => {
+        const url = p.url();
+        return {
             index: i,
-            url: p.url(),
-            title: await p.title()
-        });
-    }
+            url,
+            // A crashed or hung tab must not fail the whole listing
+            title: url === 'about:blank'
+                ? ''
+                : await p.title().catch(() => '<unavailable>')
+        };
+    }));
 
     return JSON.stringify({
         success: true,
@@ -234,11 +238,12 @@ async def browser_new_tab(url: Optional[str] = None) -> str:
     const pages = page.context().pages();
     const newIndex = pages.indexOf(newPage);
 
+    // A fresh tab is about:blank with an empty title - no need to ask for it
     return JSON.stringify({
         success: true,
         tab_index: newIndex,
         url: newPage.url(),
-        title: await newPage.title()
+        title: ''
     });
 """
 
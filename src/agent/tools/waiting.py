@@ -92,26 +92,51 @@ async def browser_wait_for_load(
     Useful after navigation or triggering content loads.
     Automatically operates on the current target tab.
 
+    Prefer "domcontentloaded", then browser_wait_for on the element you
+    actually need - that is the fastest reliable signal that a page is ready.
+
     Args:
         state: Load state to wait for:
-               - "domcontentloaded" (default): DOM is ready (fast, good for SPA)
+               - "domcontentloaded" (default, recommended): DOM is ready
                - "load": Page fully loaded including resources
-               - "networkidle": No network requests for 500ms (slow, avoid for SPA)
+               - "networkidle": No network requests for 500ms. Avoid on
+                 external sites: ads/analytics keep it waiting until timeout
         timeout: Maximum time to wait in milliseconds (default: 15000)
 
     Returns:
         JSON string with:
         - success: bool
         - state: str (the state we waited for)
+        - network_quiet: bool (only for "networkidle": false if the page
+          kept loading until timeout)
         - error: str (only if success=false)
 
     Note:
-        For SPA applications, prefer "domcontentloaded" as "networkidle" may
-        never be reached due to background requests.
+        "networkidle" is tracked by counting in-flight requests, so it
+        returns after the timeout with network_quiet=false instead of failing.
+        Requests already in flight when the tool is called are not seen; it
+        always waits for one full quiet window after it starts listening.
     """
     escaped_state = state.replace("'", "\\'")
 
-    code_body = f"""
+    if state == "networkidle":
+        code_body = f"""
+    const timeoutMs = {timeout};
+
+    const networkQuiet = await waitForNetworkQuiet(targetPage, {{
+      max: timeoutMs,
+      ready: targetPage.waitForLoadState('domcontentloaded', {{ timeout: timeoutMs }})
+    }});
+
+    return JSON.stringify({{
+      success: true,
+      state: 'networkidle',
+      network_quiet: networkQuiet
+    }});
+"""
+        helpers = ["waitForNetworkQuiet"]
+    else:
+        code_body = f"""
     const targetState = '{escaped_state}';
     const timeoutMs = {timeout};
 
@@ -122,8 +147,9 @@ async def browser_wait_for_load(
       state: targetState
     }});
 """
+        helpers = None
 
-    code = build_async_function(code_body, use_target_page=True)
+    code = build_async_function(code_body, helpers=helpers, use_target_page=True)
     result = await BrowserExecutor.execute(code)
 
     try:
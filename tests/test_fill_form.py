@@ -0,0 +1,39 @@
+"""Generated browser_fill_form code must stay valid JavaScript for any field text."""
+
+import asyncio
+import json
+import shutil
+import subprocess
+
+import pytest
+
+pytest.importorskip("langchain_core")
+
+from src.agent.tools._executor import BrowserExecutor
+from src.agent.tools.interaction import browser_fill_form
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+def test_fill_form_values_with_newlines_and_quotes(monkeypatch, tmp_path):
+    captured = []
+
+    async def fake_execute(code):
+        captured.append(code)
+        return json.dumps({"success": True, "filled": [], "submitted": False})
+
+    monkeypatch.setattr(BrowserExecutor, "execute", staticmethod(fake_execute))
+
+    fields = {
+        "textarea": "line1\nline2\r\nline3",
+        "placeholder:It's": "it's a \"quote\" \\ back\\slash",
+        "#notes": "para\u2028sep\u2029end `${x}`",
+    }
+    asyncio.run(browser_fill_form.coroutine(fields=fields, submit="button:Send 'now'"))
+
+    assert len(captured) == 1
+    script = tmp_path / "fill_form.js"
+    script.write_text(f"const fn = {captured[0]};\n", encoding="utf-8")
+    check = subprocess.run(["node", "--check", str(script)], capture_output=True, text=True)
+    assert check.returncode == 0, check.stderr
+    for text in fields.values():
+        assert json.dumps(text) in captured[0]